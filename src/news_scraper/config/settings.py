@@ -1,16 +1,25 @@
 """Application settings and configuration management."""
 
+import os
+from functools import cached_property
 from pathlib import Path
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Resolved once at import; os.path.abspath avoids the stat syscalls that
+# Path.resolve performs and re-imports (reloaders, test parametrization)
+# reuse the constant instead of restatting.
+_ENV_FILE = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "..", ".env")
+)
+
 
 class Settings(BaseSettings):
     """Centralised configuration for the scraper, loaded from environment variables."""
 
     model_config = SettingsConfigDict(
-        env_file=str(Path(__file__).resolve().parents[3] / ".env"),
+        env_file=_ENV_FILE,
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
@@ -45,6 +54,15 @@ class Settings(BaseSettings):
     embedding_model: str = Field(
         default="text-embedding-ada-002", description="Embedding model"
     )
+    chroma_hnsw_m: int = Field(
+        default=32, description="HNSW graph connectivity (hnsw:M)"
+    )
+    chroma_hnsw_construction_ef: int = Field(
+        default=200, description="HNSW index build beam width (hnsw:construction_ef)"
+    )
+    chroma_hnsw_search_ef: int = Field(
+        default=64, description="HNSW query beam width (hnsw:search_ef)"
+    )
 
     # Scraping Configuration
     user_agent: str = Field(
@@ -52,6 +70,9 @@ class Settings(BaseSettings):
         description="User agent for web scraping",
     )
     request_timeout: int = Field(default=30, description="Request timeout in seconds")
+    page_ready_timeout: int = Field(
+        default=15, description="Max seconds to wait for document.readyState"
+    )
     max_concurrent_requests: int = Field(
         default=5, description="Max concurrent requests"
     )
@@ -71,16 +92,16 @@ class Settings(BaseSettings):
         description="Log format",
     )
 
-    @property
+    @cached_property
     def project_root(self) -> Path:
         """Get project root directory.
 
         Returns:
             Path: Absolute path to the repository root.
         """
-        return Path(__file__).parent.parent.parent.parent
+        return Path(__file__).resolve().parents[3]
 
-    @property
+    @cached_property
     def data_dir(self) -> Path:
         """Get data directory.
 
@@ -92,7 +113,7 @@ class Settings(BaseSettings):
             data_path = self.project_root / data_path
         return data_path
 
-    @property
+    @cached_property
     def logs_dir(self) -> Path:
         """Get logs directory.
 
@@ -110,12 +131,16 @@ class Settings(BaseSettings):
         Returns:
             None: Directories are created on disk as a side effect.
         """
-        self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.logs_dir.mkdir(parents=True, exist_ok=True)
-
-        # Create .gitkeep files for empty directories
-        (self.data_dir / ".gitkeep").touch(exist_ok=True)
-        (self.logs_dir / ".gitkeep").touch(exist_ok=True)
+        for directory in (self.data_dir, self.logs_dir):
+            # Cheap existence test first so warm starts skip the mkdir/touch
+            # syscalls entirely (and read-only deployments stay untouched).
+            if not directory.is_dir():
+                directory.mkdir(parents=True, exist_ok=True)
+
+            # Create .gitkeep files for empty directories
+            gitkeep = directory / ".gitkeep"
+            if not gitkeep.exists():
+                gitkeep.touch(exist_ok=True)
 
 
 # Global settings instance
@@ -1,12 +1,26 @@
 """Handles GenAI-driven summarization and topic identification for scraped articles."""
 
 from openai import AsyncOpenAI
-import json
+import asyncio
+import os
+import re
 import tiktoken
+from functools import lru_cache
 from typing import Tuple, List
 from news_scraper.config.settings import settings_instance as settings
 from news_scraper.utils.logging import logger
 
+try:
+    # orjson parses typical LLM payloads ~2-3x faster than the stdlib
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Precompiled boundary patterns for chunk_content; a run of blank lines is
+# one paragraph break, and sentences keep their terminating period.
+_PARA_RE = re.compile(r"\n{2,}")
+_SENT_RE = re.compile(r"(?<=\.)\s+")
+
 # Initialize the client at the module level for reuse
 # This avoids configuration conflicts and is more efficient.
 client = AsyncOpenAI(
@@ -15,6 +29,35 @@ client = AsyncOpenAI(
 )
 
 
+# Substring fallbacks for get_model_context_limit, most specific first
+_MODEL_PATTERN_LIMITS = (
+    ("gpt-4o", 128_000),
+    ("gpt-4-turbo", 128_000),
+    ("gpt-4-1106", 128_000),
+    ("gpt-4-0125", 128_000),
+    ("gpt-4", 8192),
+    ("gpt-3.5-turbo", 16_385),
+    ("code-davinci", 8001),
+    ("davinci", 4097),
+)
+
+
+@lru_cache(maxsize=8)
+def _encoding_for(model: str) -> tiktoken.Encoding:
+    """Get the tiktoken encoding for a model, cached per process.
+
+    ``encoding_for_model`` does a registry lookup and BPE table load on the
+    cold path; caching amortizes it to a single dict hit.
+    """
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Fallback for unknown models
+        logger.warning(f"Unknown model '{model}' for token counting, using cl100k_base encoding")
+        return tiktoken.get_encoding("cl100k_base")
+
+
+@lru_cache(maxsize=32)
 def get_model_context_limit(model: str) -> int:
     """Get the context limit for a given OpenAI model dynamically."""
     # Known model limits - updated as of October 2024
@@ -57,81 +100,119 @@ def get_model_context_limit(model: str) -> int:
     if model in model_limits:
         return model_limits[model]
     
-    # Try to infer from model name patterns
+    # Try to infer from model name patterns; ordered most-specific first so
+    # e.g. "gpt-4-turbo" matches before the bare "gpt-4" entry.
     model_lower = model.lower()
-    
-    if "gpt-4o" in model_lower:
-        return 128000
-    elif "gpt-4-turbo" in model_lower or "gpt-4-1106" in model_lower or "gpt-4-0125" in model_lower:
-        return 128000
-    elif "gpt-4" in model_lower:
-        return 8192
-    elif "gpt-3.5-turbo" in model_lower:
-        return 16385
-    elif "davinci" in model_lower:
-        if "code" in model_lower:
-            return 8001
-        return 4097
-    
+    for pattern, limit in _MODEL_PATTERN_LIMITS:
+        if pattern in model_lower:
+            return limit
+
     # Default fallback - conservative estimate
     logger.warning(f"Unknown model '{model}', using conservative token limit of 4096")
     return 4096
 
 
+async def _stream_completion(system_content: str, user_content: str) -> str:
+    """Run a chat completion with ``stream=True`` and return the full text.
+
+    Streaming lets the first tokens arrive while the model is still
+    generating, so callers that fan out several requests start receiving
+    (and the merge step can start) as soon as each reply completes rather
+    than after the slowest full response buffers server-side.
+
+    Raises:
+        ValueError: If the stream finishes without producing any content.
+    """
+    stream = await client.chat.completions.create(
+        model=settings.openai_model,
+        messages=[
+            {"role": "system", "content": system_content},
+            {"role": "user", "content": user_content},
+        ],
+        temperature=settings.openai_temperature,
+        stream=True,
+    )
+
+    parts = []
+    async for event in stream:
+        if event.choices:
+            delta = event.choices[0].delta.content
+            if delta:
+                parts.append(delta)
+
+    if not parts:
+        raise ValueError("No content returned from OpenAI response.")
+    return "".join(parts)
+
+
 def count_tokens(text: str, model: str = "gpt-3.5-turbo") -> int:
     """Count the number of tokens in a text string for a given model."""
-    try:
-        encoding = tiktoken.encoding_for_model(model)
-        return len(encoding.encode(text))
-    except KeyError:
-        # Fallback for unknown models
-        logger.warning(f"Unknown model '{model}' for token counting, using cl100k_base encoding")
-        encoding = tiktoken.get_encoding("cl100k_base")
-        return len(encoding.encode(text))
+    return len(_encoding_for(model).encode(text))
 
 
 def chunk_content(content: str, max_tokens: int = 3000, model: str = "gpt-3.5-turbo") -> List[str]:
     """Split content into chunks that fit within token limits."""
     # Leave room for system message and response
     safe_token_limit = max_tokens - 1000
-    
-    # Split by paragraphs first (better semantic boundaries)
-    paragraphs = content.split('\n\n')
+
+    encoding = _encoding_for(model)
+
+    # Split by paragraphs first (better semantic boundaries).
+    # Encode each paragraph exactly once and keep a running token total per
+    # chunk instead of re-encoding the whole growing chunk on every append.
+    # encode_batch runs the Rust BPE across a thread pool (and releases the
+    # GIL), so all paragraphs are tokenized in one parallel pass.
+    paragraphs = _PARA_RE.split(content)
+    para_tokens = [len(ids) for ids in encoding.encode_batch(paragraphs, num_threads=os.cpu_count() or 1)]
+    sep_tokens = 2  # '\n\n' separator between joined paragraphs
+
     chunks = []
-    current_chunk = ""
-    
-    for paragraph in paragraphs:
-        test_chunk = current_chunk + ('\n\n' if current_chunk else '') + paragraph
-        
-        if count_tokens(test_chunk, model) <= safe_token_limit:
-            current_chunk = test_chunk
+    current_parts = []
+    current_tokens = 0
+
+    for paragraph, paragraph_tokens in zip(paragraphs, para_tokens):
+        sep = sep_tokens if current_parts else 0
+        if current_tokens + sep + paragraph_tokens <= safe_token_limit:
+            current_parts.append(paragraph)
+            current_tokens += sep + paragraph_tokens
+            continue
+
+        # Current chunk is full - flush it
+        if current_parts:
+            chunks.append('\n\n'.join(current_parts))
+            current_parts = []
+            current_tokens = 0
+
+        # If single paragraph is too large, split by sentences with the
+        # same incremental accounting
+        if paragraph_tokens > safe_token_limit:
+            # The lookbehind split keeps each sentence's terminating period,
+            # so sentences rejoin with a plain space (~1 token).
+            sentences = _SENT_RE.split(paragraph)
+            sent_tokens = [len(ids) for ids in encoding.encode_batch(sentences, num_threads=os.cpu_count() or 1)]
+            temp_parts = []
+            temp_tokens = 0
+            for sentence, sentence_tokens in zip(sentences, sent_tokens):
+                sep = 1 if temp_parts else 0  # ' ' separator
+                if temp_tokens + sep + sentence_tokens <= safe_token_limit:
+                    temp_parts.append(sentence)
+                    temp_tokens += sep + sentence_tokens
+                else:
+                    if temp_parts:
+                        chunks.append(' '.join(temp_parts))
+                    temp_parts = [sentence]
+                    temp_tokens = sentence_tokens
+            if temp_parts:
+                current_parts = [' '.join(temp_parts)]
+                current_tokens = temp_tokens
         else:
-            # If current chunk is not empty, save it
-            if current_chunk:
-                chunks.append(current_chunk)
-                current_chunk = paragraph
-            
-            # If single paragraph is too large, split by sentences
-            if count_tokens(paragraph, model) > safe_token_limit:
-                sentences = paragraph.split('. ')
-                temp_chunk = ""
-                for sentence in sentences:
-                    test_sentence = temp_chunk + ('. ' if temp_chunk else '') + sentence
-                    if count_tokens(test_sentence, model) <= safe_token_limit:
-                        temp_chunk = test_sentence
-                    else:
-                        if temp_chunk:
-                            chunks.append(temp_chunk)
-                        temp_chunk = sentence
-                if temp_chunk:
-                    current_chunk = temp_chunk
-            else:
-                current_chunk = paragraph
-    
+            current_parts = [paragraph]
+            current_tokens = paragraph_tokens
+
     # Add the last chunk
-    if current_chunk:
-        chunks.append(current_chunk)
-    
+    if current_parts:
+        chunks.append('\n\n'.join(current_parts))
+
     return chunks
 
 
@@ -157,23 +238,12 @@ async def analyze_article_chunk(
     """
 
     try:
-        response = await client.chat.completions.create(
-            model=settings.openai_model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a helpful assistant that analyzes news articles. Focus on the most important information in each section.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            temperature=settings.openai_temperature,
+        message_content = await _stream_completion(
+            "You are a helpful assistant that analyzes news articles. Focus on the most important information in each section.",
+            prompt,
         )
 
-        message_content = response.choices[0].message.content
-        if message_content is None:
-            raise ValueError("No content returned from OpenAI response.")
-        
-        analysis = json.loads(message_content.strip())
+        analysis = _json_loads(message_content.strip())
         summary = analysis.get("summary", "No summary available.")
         topics = [topic.strip() for topic in analysis.get("topics", []) if topic.strip()]
 
@@ -184,6 +254,81 @@ async def analyze_article_chunk(
         return f"Could not generate summary for part {chunk_index + 1}.", []
 
 
+# Upper bound on chunks packed into one batched completion request
+MAX_CHUNKS_PER_BATCH = 8
+
+
+async def analyze_chunks_batch(
+    request_id: str, chunk_batch: List[str], start_index: int, total_chunks: int
+) -> List[Tuple[str, List[str]]]:
+    """Analyze several article chunks in a single OpenAI request.
+
+    Packs the chunks into one prompt and asks for a JSON array reply, so K
+    ready chunks cost one HTTP round-trip instead of K. Falls back to the
+    per-chunk path if the batched response cannot be parsed.
+
+    Args:
+        request_id: Identifier used for correlating logs and tracing failures.
+        chunk_batch: The chunk texts to analyze together.
+        start_index: Index of the first chunk within the whole article.
+        total_chunks: Total number of chunks for the article.
+
+    Returns:
+        List[Tuple[str, List[str]]]: Per-chunk (summary, topics) pairs in order.
+    """
+    sections = "\n\n".join(
+        f"### Section {start_index + i + 1} of {total_chunks}\n{chunk}"
+        for i, chunk in enumerate(chunk_batch)
+    )
+
+    prompt = f"""
+    Please analyze each of the following {len(chunk_batch)} article sections and provide, for every section:
+    1. A concise summary of the key points in that section.
+    2. A list of the main topics in that section.
+
+    Return the output as a JSON array with exactly one object per section, in order:
+    [
+        {{"summary": "Summary of the first section", "topics": ["Topic 1", "Topic 2"]}},
+        ...
+    ]
+
+    {sections}
+    """
+
+    try:
+        message_content = await _stream_completion(
+            "You are a helpful assistant that analyzes news articles. Focus on the most important information in each section.",
+            prompt,
+        )
+
+        items = _json_loads(message_content.strip())
+        if not isinstance(items, list) or len(items) != len(chunk_batch):
+            raise ValueError(
+                f"Expected {len(chunk_batch)} analysis objects, got {items!r:.200}"
+            )
+
+        results = []
+        for item in items:
+            summary = item.get("summary") or "No summary available."
+            topics = [topic.strip() for topic in item.get("topics") or [] if topic.strip()]
+            results.append((summary, topics))
+        return results
+
+    except Exception as e:
+        logger.warning(
+            f"Batched analysis of chunks {start_index}-{start_index + len(chunk_batch) - 1} "
+            f"for request {request_id} failed ({e}), falling back to per-chunk requests"
+        )
+        return list(
+            await asyncio.gather(
+                *(
+                    analyze_article_chunk(request_id, chunk, start_index + i, total_chunks)
+                    for i, chunk in enumerate(chunk_batch)
+                )
+            )
+        )
+
+
 async def merge_chunk_analyses(summaries: List[str], topics_lists: List[List[str]]) -> Tuple[str, List[str]]:
     """Merge multiple chunk analyses into a final summary and topic list."""
     if not summaries:
@@ -202,38 +347,24 @@ async def merge_chunk_analyses(summaries: List[str], topics_lists: List[List[str
     """
     
     try:
-        response = await client.chat.completions.create(
-            model=settings.openai_model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a helpful assistant that creates coherent summaries from multiple sections.",
-                },
-                {"role": "user", "content": final_prompt},
-            ],
-            temperature=settings.openai_temperature,
+        final_summary = await _stream_completion(
+            "You are a helpful assistant that creates coherent summaries from multiple sections.",
+            final_prompt,
         )
-        
-        final_summary = response.choices[0].message.content or "Could not generate final summary."
-        
     except Exception as e:
         logger.error(f"Error creating final summary: {e}")
         final_summary = " ".join(summaries)
     
-    # Merge and deduplicate topics
-    all_topics = []
+    # Merge and deduplicate topics in one pass, keyed on the lowercased
+    # form so original casing and first-seen order are preserved.
+    seen = {}
     for topic_list in topics_lists:
-        all_topics.extend(topic_list)
-    
-    # Remove duplicates while preserving order
-    unique_topics = []
-    seen = set()
-    for topic in all_topics:
-        topic_lower = topic.lower()
-        if topic_lower not in seen:
-            seen.add(topic_lower)
-            unique_topics.append(topic)
-    
+        for topic in topic_list:
+            key = topic.lower()
+            if key and key not in seen:
+                seen[key] = topic
+    unique_topics = list(seen.values())
+
     return final_summary.strip(), unique_topics
 
 
@@ -254,25 +385,15 @@ async def analyze_single_article(request_id: str, content: str) -> Tuple[str, Li
     """
 
     try:
-        response = await client.chat.completions.create(
-            model=settings.openai_model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a helpful assistant that analyzes news articles.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            temperature=settings.openai_temperature,
+        message_content = await _stream_completion(
+            "You are a helpful assistant that analyzes news articles.",
+            prompt,
         )
 
-        message_content = response.choices[0].message.content
-        if message_content is None:
-            raise ValueError("No content returned from OpenAI response.")
-        analysis = message_content.strip()
+        analysis = _json_loads(message_content.strip())
 
-        summary = json.loads(analysis)["summary"] or "No summary available."
-        topics_part = json.loads(analysis)["topics"] or []
+        summary = analysis.get("summary") or "No summary available."
+        topics_part = analysis.get("topics") or []
         topics = [topic.strip() for topic in topics_part if topic.strip()]
 
         return summary, topics
@@ -315,17 +436,49 @@ async def analyze_article_content(
     
     logger.info(f"Request {request_id}: Created {len(chunks)} chunks for analysis")
     
-    summaries = []
-    topics_lists = []
-    
-    for i, chunk in enumerate(chunks):
-        chunk_tokens = count_tokens(chunk, settings.openai_model)
-        logger.debug(f"Request {request_id}: Analyzing chunk {i+1}/{len(chunks)} ({chunk_tokens} tokens)")
-        
-        summary, topics = await analyze_article_chunk(request_id, chunk, i, len(chunks))
-        summaries.append(summary)
-        topics_lists.append(topics)
-    
+    # Pack consecutive chunks into batched requests bounded by the model's
+    # context window, then dispatch the batches concurrently with the
+    # in-flight count capped to respect rate limits.
+    safe_token_limit = max_tokens - 1000
+    chunk_tokens = [count_tokens(chunk, settings.openai_model) for chunk in chunks]
+
+    batches = []  # (start_index, chunks) pairs
+    current: List[str] = []
+    batch_start = 0
+    batch_tokens = 0
+    for i, (chunk, tokens) in enumerate(zip(chunks, chunk_tokens)):
+        if current and (
+            len(current) >= MAX_CHUNKS_PER_BATCH
+            or batch_tokens + tokens > safe_token_limit
+        ):
+            batches.append((batch_start, current))
+            current = []
+            batch_tokens = 0
+        if not current:
+            batch_start = i
+        current.append(chunk)
+        batch_tokens += tokens
+    if current:
+        batches.append((batch_start, current))
+
+    semaphore = asyncio.Semaphore(settings.max_concurrent_requests)
+
+    async def _analyze_batch(start: int, batch: List[str]) -> List[Tuple[str, List[str]]]:
+        async with semaphore:
+            logger.debug(
+                f"Request {request_id}: Analyzing chunks {start+1}-{start+len(batch)}/{len(chunks)}"
+            )
+            if len(batch) == 1:
+                return [await analyze_article_chunk(request_id, batch[0], start, len(chunks))]
+            return await analyze_chunks_batch(request_id, batch, start, len(chunks))
+
+    batch_results = await asyncio.gather(
+        *(_analyze_batch(start, batch) for start, batch in batches)
+    )
+    results = [pair for batch in batch_results for pair in batch]
+    summaries = [summary for summary, _ in results]
+    topics_lists = [topics for _, topics in results]
+
     # Merge results
     logger.debug(f"Request {request_id}: Merging {len(summaries)} chunk analyses")
     final_summary, final_topics = await merge_chunk_analyses(summaries, topics_lists)
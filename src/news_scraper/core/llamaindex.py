@@ -1,6 +1,15 @@
 """Initialise LlamaIndex components backed by the persisted ChromaDB store."""
 
-from llama_index.core import VectorStoreIndex, StorageContext
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List
+
+import numpy as np
+from llama_index.core import PromptTemplate, VectorStoreIndex, StorageContext
+from llama_index.core.query_engine import RetrieverQueryEngine
+from llama_index.core.retrievers import BaseRetriever
+from llama_index.core.schema import NodeWithScore, QueryBundle, TextNode
 from llama_index.vector_stores.chroma import ChromaVectorStore
 from llama_index.llms.openai import OpenAI
 from llama_index.embeddings.openai import OpenAIEmbedding
@@ -10,54 +19,341 @@ from llama_index.core import Settings
 from news_scraper.config.settings import settings_instance as settings
 from news_scraper.utils.logging import logger
 from news_scraper.db import ChromaDBClient
+from news_scraper.db import embedding_cache
 
-# Configure the embedding model BEFORE creating any indices
-# This ensures LlamaIndex uses OpenAI embeddings (1536 dimensions)
-embed_model = OpenAIEmbedding(
-    model=settings.embedding_model, api_key=settings.openai_api_key
-)
-Settings.embed_model = embed_model
 
-# Get the db collection
-db = ChromaDBClient()
-chroma_collection = db.get_collection()
-logger.debug(
-    f"Successfully loaded ChromaDB collection '{chroma_collection.name}' with {chroma_collection.count()} articles."
-)
+class CachedOpenAIEmbedding(OpenAIEmbedding):
+    """OpenAI embedder backed by the persistent content-hash cache.
 
-# Create a LlamaIndex VectorStore object
-# This acts as a wrapper around your ChromaDB collection.
-vector_store = ChromaVectorStore(chroma_collection=chroma_collection)
-
-# Create the LlamaIndex Storage Context
-# This tells LlamaIndex where to "store" its knowledge, which in our case,
-# is the ChromaDB vector store we just connected.
-storage_context = StorageContext.from_defaults(vector_store=vector_store)
-
-# Create the LlamaIndex Index
-# This is the main object that LlamaIndex uses to know about your data.
-# We are creating it *from* the vector store, so it doesn't try to create new embeddings.
-index = VectorStoreIndex.from_vector_store(
-    vector_store,
-    storage_context=storage_context,
-)
-logger.debug("LlamaIndex has now successfully connected to the ChromaDB vector store.")
+    Re-indexing unchanged articles previously re-embedded every text via
+    the remote API. Texts are looked up in the shared embedding cache
+    (keyed by model + content hash), so only texts never seen by this
+    model pay the network round-trip.
+    """
 
-# Configure the LLM (this is separate from embeddings)
-llm = OpenAI(
-    model=settings.openai_model,
-    temperature=settings.openai_temperature,
-    api_key=settings.openai_api_key,
-)
-Settings.llm = llm
-
-# Create the query engine. This is the primary tool for asking questions.
-# It chains together the retrieval from ChromaDB and the answer synthesis by the LLM.
-query_engine = index.as_query_engine(
-    # You can configure how many top matching articles to retrieve.
-    # This helps balance the thoroughness of the answer with speed and cost.
-    similarity_top_k=settings.llama_similarity_top_k,
-    response_mode=settings.llama_response_mode,  # "compact" or "tree_summarize"
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        keys = [embedding_cache.text_key(self.model_name, text) for text in texts]
+        cached = embedding_cache.get_many(keys)
+
+        misses = [
+            (i, text)
+            for i, (text, key) in enumerate(zip(texts, keys))
+            if key not in cached
+        ]
+        if misses:
+            fresh = super()._get_text_embeddings([text for _, text in misses])
+            new_entries = {
+                keys[i]: vector for (i, _), vector in zip(misses, fresh)
+            }
+            embedding_cache.set_many(new_entries)
+            cached.update(new_entries)
+            logger.debug(
+                f"Embedded {len(misses)} texts, served {len(texts) - len(misses)} from cache"
+            )
+
+        return [cached[key] for key in keys]
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        return self._get_text_embeddings([text])[0]
+
+
+@lru_cache(maxsize=1)
+def get_embed_model() -> CachedOpenAIEmbedding:
+    """Build (once, on first use) the shared OpenAI embedding model.
+
+    Configures the embedding model BEFORE any index is created so LlamaIndex
+    uses OpenAI embeddings (1536 dimensions); embed_batch_size makes
+    ingestion send up to 256 texts per embeddings request instead of paying
+    the HTTP round-trip per node.
+
+    Returns:
+        CachedOpenAIEmbedding: The process-wide embedding model.
+    """
+    embed_model = CachedOpenAIEmbedding(
+        model=settings.embedding_model,
+        api_key=settings.openai_api_key,
+        embed_batch_size=256,
+    )
+    Settings.embed_model = embed_model
+    return embed_model
+
+
+@lru_cache(maxsize=1)
+def get_db() -> ChromaDBClient:
+    """Get the process-wide ChromaDB client wrapper.
+
+    Returns:
+        ChromaDBClient: Client connected to the persisted article store.
+    """
+    return ChromaDBClient()
+
+
+@lru_cache(maxsize=1)
+def get_index() -> VectorStoreIndex:
+    """Build (once, on first use) the LlamaIndex index over the Chroma store.
+
+    The index is created *from* the existing vector store, so it doesn't try
+    to create new embeddings.
+
+    Returns:
+        VectorStoreIndex: Index wrapping the persisted ChromaDB collection.
+    """
+    # The embedding model must be configured before the index is created
+    get_embed_model()
+
+    chroma_collection = get_db().get_collection()
+    logger.debug(
+        f"Successfully loaded ChromaDB collection '{chroma_collection.name}' with {chroma_collection.count()} articles."
+    )
+
+    # The vector store acts as a wrapper around the ChromaDB collection, and
+    # the storage context tells LlamaIndex where its knowledge lives.
+    vector_store = ChromaVectorStore(chroma_collection=chroma_collection)
+    storage_context = StorageContext.from_defaults(vector_store=vector_store)
+
+    index = VectorStoreIndex.from_vector_store(
+        vector_store,
+        storage_context=storage_context,
+    )
+    logger.debug("LlamaIndex has now successfully connected to the ChromaDB vector store.")
+    return index
+
+
+# Custom QA template with all static instructions at the very top and the
+# per-query parts (retrieved context, then the query) last. Keeping the
+# leading tokens byte-identical across queries lets OpenAI's automatic
+# prompt-prefix cache skip re-prefilling them on every request.
+_TEXT_QA_TEMPLATE = PromptTemplate(
+    "You are a news research assistant answering questions over a corpus of "
+    "scraped news articles.\n"
+    "Follow these rules for every answer:\n"
+    "1. Base the answer only on the context information provided below, not "
+    "on prior knowledge.\n"
+    "2. When several articles cover the same event, prefer the most recent "
+    "reporting and note disagreements between sources.\n"
+    "3. Attribute claims to their articles where possible (by title or "
+    "source domain) rather than presenting them as established fact.\n"
+    "4. If the context does not contain enough information to answer, say "
+    "so explicitly instead of guessing.\n"
+    "5. Keep answers concise and factual; do not speculate about events "
+    "after the articles were written.\n"
+    "\n"
+    "Context information from the most relevant articles is below.\n"
+    "---------------------\n"
+    "{context_str}\n"
+    "---------------------\n"
+    "Query: {query_str}\n"
+    "Answer: "
 )
 
-logger.debug("Query engine is ready.")
+# MMR retrieval knobs: prefetch this many times the configured top-k from
+# Chroma, then trade relevance (lambda) against redundancy (1 - lambda).
+_MMR_PREFETCH_FACTOR = 3
+_MMR_LAMBDA = 0.5
+
+
+class MMRRetriever(BaseRetriever):
+    """Retrieve a diversified top-k from Chroma via maximal marginal relevance.
+
+    Chroma only answers plain nearest-neighbour queries (``Collection.query``
+    has no MMR mode), so the rerank runs client-side: prefetch
+    ``top_k * _MMR_PREFETCH_FACTOR`` candidates together with their stored
+    embeddings, score the whole set with one matrix product, then greedily
+    pick results that are relevant to the query but dissimilar from what has
+    already been picked, so near-duplicate chunks of one story don't crowd
+    out other relevant articles.
+    """
+
+    def __init__(self, collection, top_k: int) -> None:
+        """Wrap a Chroma collection for diversified retrieval.
+
+        Args:
+            collection: ChromaDB collection holding the article chunks.
+            top_k: Number of nodes to return after the MMR rerank.
+        """
+        super().__init__()
+        self._collection = collection
+        self._top_k = top_k
+
+    def _retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        # cached_query already embedded the query for its semantic-cache
+        # probe and passes the vector through the bundle; only embed here
+        # when called without one.
+        query_embedding = query_bundle.embedding
+        if query_embedding is None:
+            query_embedding = get_embed_model().get_query_embedding(
+                query_bundle.query_str
+            )
+        results = self._collection.query(
+            query_embeddings=[query_embedding],
+            n_results=self._top_k * _MMR_PREFETCH_FACTOR,
+            include=["documents", "metadatas", "embeddings"],
+        )
+        ids = results["ids"][0]
+        if not ids:
+            return []
+
+        # Unit-normalise once so both query and pairwise similarities are
+        # plain dot products over the candidate matrix.
+        candidates = np.asarray(results["embeddings"][0], dtype=np.float32)
+        norms = np.linalg.norm(candidates, axis=1, keepdims=True)
+        np.maximum(norms, 1e-12, out=norms)
+        candidates /= norms
+        query_vec = np.asarray(query_embedding, dtype=np.float32)
+        query_vec /= max(float(np.linalg.norm(query_vec)), 1e-12)
+
+        query_sims = candidates @ query_vec
+        pairwise_sims = candidates @ candidates.T
+
+        selected = [int(np.argmax(query_sims))]
+        remaining = [i for i in range(len(ids)) if i != selected[0]]
+        while remaining and len(selected) < self._top_k:
+            redundancy = pairwise_sims[np.ix_(remaining, selected)].max(axis=1)
+            mmr_scores = (
+                _MMR_LAMBDA * query_sims[remaining]
+                - (1 - _MMR_LAMBDA) * redundancy
+            )
+            best = remaining[int(np.argmax(mmr_scores))]
+            selected.append(best)
+            remaining.remove(best)
+
+        documents = results["documents"][0]
+        metadatas = results["metadatas"][0]
+        return [
+            NodeWithScore(
+                node=TextNode(
+                    id_=ids[i], text=documents[i], metadata=metadatas[i] or {}
+                ),
+                score=float(query_sims[i]),
+            )
+            for i in selected
+        ]
+
+
+@lru_cache(maxsize=1)
+def get_query_engine():
+    """Build (once, on first use) the query engine over the article index.
+
+    The query engine is the primary tool for asking questions; it chains
+    together retrieval from ChromaDB and answer synthesis by the LLM.
+
+    Returns:
+        The configured LlamaIndex query engine.
+    """
+    # Configure the LLM (this is separate from embeddings)
+    llm = OpenAI(
+        model=settings.openai_model,
+        temperature=settings.openai_temperature,
+        api_key=settings.openai_api_key,
+    )
+    Settings.llm = llm
+    # Make sure the shared embedding model is configured before any query
+    get_embed_model()
+
+    # top_k balances the thoroughness of the answer with speed and cost;
+    # the retriever prefetches a multiple of it and reranks client-side.
+    retriever = MMRRetriever(
+        collection=get_db().get_collection(),
+        top_k=settings.llama_similarity_top_k,
+    )
+    query_engine = RetrieverQueryEngine.from_args(
+        retriever,
+        response_mode=settings.llama_response_mode,  # "compact" or "tree_summarize"
+        text_qa_template=_TEXT_QA_TEMPLATE,
+        # Surface tokens as they arrive instead of blocking on the full
+        # completion; callers iterate response.response_gen.
+        streaming=True,
+    )
+    logger.debug("Query engine is ready.")
+    return query_engine
+
+
+# Semantic response cache: questions that are near-duplicates of an earlier
+# one (cosine distance below the threshold) are answered from the cache and
+# skip retrieval and LLM synthesis entirely.
+_SEMANTIC_CACHE_THRESHOLD = 0.05
+
+# Exact-match tier in front of the semantic cache: literal repeats (after
+# case/whitespace normalisation) skip even the query embedding.
+_EXACT_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_EXACT_CACHE_MAX = 256
+
+
+@lru_cache(maxsize=1)
+def _get_response_cache():
+    """Get the Chroma collection backing the semantic response cache."""
+    return get_db().get_or_create_aux_collection(
+        "query_response_cache", metadata={"hnsw:space": "cosine"}
+    )
+
+
+def cached_query(query: str):
+    """Answer a query, serving semantically near-duplicate questions from cache.
+
+    Args:
+        query: Natural-language question to answer.
+
+    Returns:
+        The full query-engine response on a miss, or the cached response
+        text (a plain string, without source nodes) on a hit.
+    """
+    normalized_query = query.strip().lower()
+    if normalized_query in _EXACT_CACHE:
+        _EXACT_CACHE.move_to_end(normalized_query)
+        logger.debug(f"Exact cache hit for query: {query}")
+        return _EXACT_CACHE[normalized_query]
+
+    query_embedding = get_embed_model().get_query_embedding(query)
+
+    _response_cache = _get_response_cache()
+    if _response_cache.count() > 0:
+        hits = _response_cache.query(
+            query_embeddings=[query_embedding],
+            n_results=1,
+            include=["metadatas", "distances"],
+        )
+        if hits["ids"][0] and hits["distances"][0][0] < _SEMANTIC_CACHE_THRESHOLD:
+            logger.debug(
+                f"Semantic cache hit (distance {hits['distances'][0][0]:.4f}) for query: {query}"
+            )
+            response_text = hits["metadatas"][0][0]["response"]
+            # Promote to the exact tier so a literal repeat skips embedding
+            _EXACT_CACHE[normalized_query] = response_text
+            while len(_EXACT_CACHE) > _EXACT_CACHE_MAX:
+                _EXACT_CACHE.popitem(last=False)
+            return response_text
+
+    def _record(response_text: str) -> None:
+        _EXACT_CACHE[normalized_query] = response_text
+        while len(_EXACT_CACHE) > _EXACT_CACHE_MAX:
+            _EXACT_CACHE.popitem(last=False)
+        _response_cache.add(
+            ids=[hashlib.sha256(query.encode()).hexdigest()],
+            embeddings=[query_embedding],
+            documents=[query],
+            metadatas=[{"response": response_text}],
+        )
+
+    # Hand the probe's embedding to the engine so the retriever doesn't
+    # pay a second embedding round-trip for the same string
+    response = get_query_engine().query(
+        QueryBundle(query_str=query, embedding=query_embedding)
+    )
+
+    if hasattr(response, "response_gen"):
+        # Streaming response: tee the token generator so the full text is
+        # cached once the caller finishes consuming it.
+        original_gen = response.response_gen
+
+        def _tee():
+            parts = []
+            for token in original_gen:
+                parts.append(token)
+                yield token
+            _record("".join(parts))
+
+        response.response_gen = _tee()
+    else:
+        _record(str(response))
+
+    return response
@@ -1,9 +1,40 @@
 """ChromaDB client for storing and retrieving news articles."""
 
-import json
+import asyncio
+import os
+import threading
 import tiktoken
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Set, Tuple
+
+try:
+    # orjson serializes the small metadata lists 2-5x faster than stdlib json
+    from orjson import dumps as _orjson_dumps
+
+    def _json_dumps(value: Any) -> str:
+        return _orjson_dumps(value).decode()
+
+except ImportError:
+    from json import dumps as _json_dumps  # type: ignore[assignment]
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert a where-filter value into a hashable form.
+
+    Args:
+        value: Filter dict, list or scalar.
+
+    Returns:
+        A hashable equivalent usable as part of a cache key.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(item) for item in value)
+    return value
 
 import chromadb
 from chromadb.api import ClientAPI
@@ -11,17 +42,51 @@ from chromadb.api.models.Collection import Collection
 from chromadb.config import Settings as ChromaSettings
 from chromadb.utils.embedding_functions import OpenAIEmbeddingFunction
 from loguru import logger
+from openai import AsyncOpenAI, OpenAI
 
 from news_scraper.models.article import Article
 from news_scraper.config.settings import settings_instance as settings
+from news_scraper.db import embedding_cache
 
 
 class ChromaDBClient:
-    """ChromaDB client for managing news articles."""
+    """ChromaDB client for managing news articles.
+
+    Instances are process-wide singletons keyed by (db_path, collection
+    name): constructing the client repeatedly returns the same object, so
+    callers don't pay SQLite open/schema-check latency (or reload HNSW
+    indices) per construction.
+    """
 
     # Maximum tokens for the embedding model (with safety margin)
     MAX_EMBEDDING_TOKENS = 8000  # Leave some buffer from the 8192 limit
 
+    # Maximum inputs per embeddings API request (API cap is 2048; stay
+    # comfortably below the 300k-tokens-per-request limit with 8k chunks)
+    MAX_EMBED_BATCH_INPUTS = 512
+
+    # Concurrent in-flight embeddings requests and retry budget for
+    # rate-limit / transient server errors
+    EMBED_CONCURRENCY = 8
+    EMBED_MAX_RETRIES = 3
+
+    # Maximum cached search results before the least recent is evicted
+    SEARCH_CACHE_MAX = 1024
+
+    _instances: ClassVar[Dict[Tuple[str, str], "ChromaDBClient"]] = {}
+    _instances_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __new__(
+        cls, db_path: str = "./data/db", collection_name: str = "news_articles"
+    ):
+        key = (str(Path(db_path)), collection_name)
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = super().__new__(cls)
+                cls._instances[key] = instance
+        return instance
+
     def __init__(
         self, db_path: str = "./data/db", collection_name: str = "news_articles"
     ):
@@ -32,6 +97,10 @@ class ChromaDBClient:
             db_path: Path to the database directory
             collection_name: Name of the collection to use
         """
+        # __new__ may hand back an already-initialized singleton
+        if getattr(self, "_initialized", False):
+            return
+
         self.db_path = Path(db_path)
         self.collection_name = collection_name
         self._client: ClientAPI
@@ -49,7 +118,58 @@ class ChromaDBClient:
         # Ensure database directory exists
         self.db_path.mkdir(parents=True, exist_ok=True)
 
+        # In-process LRU cache for search_articles, invalidated on writes
+        self._search_cache: Dict[Tuple[Any, ...], List[Dict[str, Any]]] = {}
+
         self._initialize_db()
+        self._initialized = True
+
+    @staticmethod
+    def _collection_metadata() -> Dict[str, Any]:
+        """
+        Build the collection metadata including HNSW tuning parameters.
+
+        The hnsw:* keys only take effect when the collection is first
+        created; existing collections keep the parameters they were built
+        with. search_ef is floored at 4x the configured retrieval top-k so
+        queries keep enough beam width to fill their result set.
+
+        Returns:
+            Metadata dictionary for get_or_create_collection
+        """
+        return {
+            "description": "News articles collection",
+            "hnsw:space": "cosine",
+            "hnsw:M": settings.chroma_hnsw_m,
+            "hnsw:construction_ef": settings.chroma_hnsw_construction_ef,
+            "hnsw:search_ef": max(
+                settings.chroma_hnsw_search_ef, settings.llama_similarity_top_k * 4
+            ),
+            "hnsw:num_threads": os.cpu_count() or 1,
+        }
+
+    @classmethod
+    def close_all(cls) -> None:
+        """
+        Drop all cached client instances for graceful shutdown.
+
+        Subsequent constructions reconnect from scratch. Chroma's shared
+        system cache is cleared too (where the installed version exposes
+        it) so the underlying SQLite connections are released.
+
+        Returns:
+            None
+        """
+        with cls._instances_lock:
+            count = len(cls._instances)
+            cls._instances.clear()
+        try:
+            from chromadb.api.client import SharedSystemClient
+
+            SharedSystemClient.clear_system_cache()
+        except (ImportError, AttributeError):
+            pass
+        logger.info(f"Closed {count} cached ChromaDB client(s)")
 
     def _initialize_db(self) -> None:
         """Initialize the ChromaDB client and collection with OpenAI embeddings.
@@ -68,16 +188,21 @@ class ChromaDBClient:
             )
 
             # Create OpenAI embedding function
-            # This ensures ChromaDB uses OpenAI embeddings (1536 dimensions)
-            embedding_function = OpenAIEmbeddingFunction(
+            # This ensures ChromaDB uses OpenAI embeddings (1536 dimensions).
+            # Writes precompute embeddings client-side (see _embed_batch);
+            # the function stays attached so the query path keeps working.
+            self._embedding_function = OpenAIEmbeddingFunction(
                 api_key=settings.openai_api_key, model_name=settings.embedding_model
             )
 
+            # Direct client for batched write-path embedding requests
+            self._openai = OpenAI(api_key=settings.openai_api_key)
+
             # Get or create collection with OpenAI embeddings
             self._collection = self._client.get_or_create_collection(
                 name=self.collection_name,
-                metadata={"description": "News articles collection"},
-                embedding_function=embedding_function,  # type: ignore
+                metadata=self._collection_metadata(),
+                embedding_function=self._embedding_function,  # type: ignore
             )
 
             logger.info(f"ChromaDB initialized at {self.db_path}")
@@ -89,6 +214,165 @@ class ChromaDBClient:
             logger.error(f"Failed to initialize ChromaDB: {e}")
             raise
 
+    def _sysdb_connection(self):
+        """
+        Best-effort access to Chroma's internal metadata SQLite connection.
+
+        The attribute chain is private API and has moved between Chroma
+        releases, so every hop is guarded; callers must tolerate None.
+
+        Returns:
+            A DB-API connection, or None when the internals are unavailable
+        """
+        sysdb = getattr(self._client, "_sysdb", None)
+        if sysdb is None:
+            sysdb = getattr(getattr(self._client, "_server", None), "_sysdb", None)
+        pool = getattr(sysdb, "_conn_pool", None)
+        if pool is None:
+            return None
+        try:
+            return pool.connect()
+        except Exception as e:
+            logger.debug(f"Could not reach Chroma's SQLite connection: {e}")
+            return None
+
+    @contextmanager
+    def bulk_mode(self):
+        """
+        Relax SQLite durability settings for the duration of a bulk load.
+
+        Bulk ingest is fsync-bound: with default settings every write
+        transaction waits for the journal to hit disk. WAL journaling with
+        synchronous=NORMAL, an in-memory temp store and a larger page
+        cache remove most of that wait. Trade-off: a power loss during the
+        block can lose the most recent transactions (never corrupt the
+        database); acceptable for re-runnable scrape ingestion. Defaults
+        are restored on exit, and the context degrades to a no-op when
+        Chroma's internals aren't reachable.
+        """
+        conn = self._sysdb_connection()
+        if conn is None:
+            yield
+            return
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-262144")
+            conn.execute("PRAGMA mmap_size=1073741824")
+            logger.debug("SQLite tuned for bulk ingestion")
+            yield
+        finally:
+            # WAL persists in the database file and is safe to keep; the
+            # durability and memory settings go back to SQLite defaults.
+            try:
+                conn.execute("PRAGMA synchronous=FULL")
+                conn.execute("PRAGMA temp_store=DEFAULT")
+                conn.execute("PRAGMA cache_size=-2000")
+                conn.execute("PRAGMA mmap_size=0")
+                logger.debug("SQLite durability defaults restored")
+            except Exception as e:
+                logger.warning(f"Failed to restore SQLite defaults: {e}")
+
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts with direct, batched OpenAI embeddings requests.
+
+        Passing the resulting vectors to add() via embeddings= keeps the
+        collection's embedding function out of the write path, where it
+        would otherwise issue its own HTTP call per add(). Texts already
+        present in the persistent embedding cache are served locally, so
+        re-ingesting known articles skips the API entirely.
+
+        Args:
+            texts: Documents to embed
+
+        Returns:
+            One embedding vector per input text, in input order
+        """
+        keys = [
+            embedding_cache.text_key(settings.embedding_model, text) for text in texts
+        ]
+        cached = embedding_cache.get_many(keys)
+
+        miss_texts = [
+            text for text, key in zip(texts, keys) if key not in cached
+        ]
+        if miss_texts:
+            if len(miss_texts) <= self.MAX_EMBED_BATCH_INPUTS:
+                # Single request - no event loop needed
+                response = self._openai.embeddings.create(
+                    input=miss_texts, model=settings.embedding_model
+                )
+                fresh = [item.embedding for item in response.data]
+            else:
+                fresh = asyncio.run(self._embed_batch_async(miss_texts))
+
+            new_entries = {
+                embedding_cache.text_key(settings.embedding_model, text): vector
+                for text, vector in zip(miss_texts, fresh)
+            }
+            embedding_cache.set_many(new_entries)
+            cached.update(new_entries)
+            logger.debug(
+                f"Embedded {len(miss_texts)} documents, served "
+                f"{len(texts) - len(miss_texts)} from cache"
+            )
+
+        return [cached[key] for key in keys]
+
+    async def _embed_batch_async(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts with concurrently pipelined OpenAI requests.
+
+        Embedding is HTTP-bound, so request-sized sub-batches are fanned
+        out under a bounded semaphore instead of waiting on each response
+        in turn. Rate-limit and transient server errors retry with
+        exponential backoff; anything else propagates.
+
+        Args:
+            texts: Documents to embed
+
+        Returns:
+            One embedding vector per input text, in input order
+        """
+        semaphore = asyncio.Semaphore(self.EMBED_CONCURRENCY)
+
+        async with AsyncOpenAI(api_key=settings.openai_api_key) as client:
+
+            async def _embed_slice(slice_texts: List[str]) -> List[List[float]]:
+                async with semaphore:
+                    delay = 1.0
+                    for attempt in range(self.EMBED_MAX_RETRIES + 1):
+                        try:
+                            response = await client.embeddings.create(
+                                input=slice_texts, model=settings.embedding_model
+                            )
+                            return [item.embedding for item in response.data]
+                        except Exception as e:
+                            status = getattr(e, "status_code", None)
+                            retryable = status == 429 or (
+                                status is not None and status >= 500
+                            )
+                            if attempt >= self.EMBED_MAX_RETRIES or not retryable:
+                                raise
+                            logger.warning(
+                                f"Embeddings request failed with {status}, retrying in {delay:.0f}s"
+                            )
+                            await asyncio.sleep(delay)
+                            delay *= 2
+                    return []  # Unreachable; keeps type checkers happy
+
+            slices = [
+                texts[start : start + self.MAX_EMBED_BATCH_INPUTS]
+                for start in range(0, len(texts), self.MAX_EMBED_BATCH_INPUTS)
+            ]
+            results = await asyncio.gather(
+                *(_embed_slice(slice_texts) for slice_texts in slices)
+            )
+
+        return [vector for slice_vectors in results for vector in slice_vectors]
+
     def _count_tokens(self, text: str) -> int:
         """
         Count tokens in text using the OpenAI tokenizer.
@@ -101,94 +385,101 @@ class ChromaDBClient:
         """
         return len(self._tokenizer.encode(text))
 
-    def _chunk_text(self, text: str, max_tokens: int) -> List[str]:
+    def _count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """
+        Count tokens for many texts with one parallel encode_batch call.
+
+        encode_batch releases the GIL and runs the BPE across cores, so
+        bulk ingestion tokenizes all candidate documents in a single pass
+        instead of one encode call per article.
+
+        Args:
+            texts: Texts to count tokens for
+
+        Returns:
+            Token counts, in input order
+        """
+        return [
+            len(encoded)
+            for encoded in self._tokenizer.encode_batch(
+                texts, num_threads=os.cpu_count() or 1
+            )
+        ]
+
+    # How far (in tokens) a chunk boundary may back off to land on a
+    # sentence end instead of splitting mid-sentence
+    BOUNDARY_BACKOFF_TOKENS = 32
+
+    # Tokens repeated between consecutive chunks so a sentence cut at a
+    # boundary stays retrievable from the following chunk
+    CHUNK_OVERLAP_TOKENS = 200
+
+    def _chunk_text(
+        self, text: str, max_tokens: int, overlap: Optional[int] = None
+    ) -> List[str]:
         """
         Split text into chunks that don't exceed max_tokens.
-        Uses sentence-based chunking for better semantic coherence.
+        Tokenizes the whole text once and slices the token array into
+        max_tokens-sized windows, instead of re-encoding every sentence
+        (and every word of long sentences) separately. Each boundary backs
+        off to the nearest sentence end within a short window so chunks
+        still break on sentences where possible, and consecutive chunks
+        share an overlap so context cut at one boundary survives in the
+        next window.
 
         Args:
             text: Text to chunk
             max_tokens: Maximum tokens per chunk
+            overlap: Tokens shared between consecutive chunks (defaults to
+                CHUNK_OVERLAP_TOKENS, clamped below max_tokens)
 
         Returns:
             List of text chunks
         """
-        # Split by sentences (simple approach)
-        sentences = text.replace("\n", " ").split(". ")
-
-        chunks = []
-        current_chunk = []
-        current_tokens = 0
-
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if not sentence:
-                continue
+        if overlap is None:
+            overlap = self.CHUNK_OVERLAP_TOKENS
+        # The window must always advance, even for small max_tokens
+        overlap = max(0, min(overlap, max_tokens // 2))
 
-            # Add period back if it was removed
-            if not sentence.endswith("."):
-                sentence += "."
-
-            sentence_tokens = self._count_tokens(sentence)
-
-            # If a single sentence exceeds max_tokens, split it further
-            if sentence_tokens > max_tokens:
-                # If we have accumulated text, save it first
-                if current_chunk:
-                    chunks.append(" ".join(current_chunk))
-                    current_chunk = []
-                    current_tokens = 0
-
-                # Split the long sentence by words
-                words = sentence.split()
-                word_chunk = []
-                word_tokens = 0
-
-                for word in words:
-                    word_token_count = self._count_tokens(word + " ")
-                    if word_tokens + word_token_count > max_tokens:
-                        if word_chunk:
-                            chunks.append(" ".join(word_chunk))
-                        word_chunk = [word]
-                        word_tokens = word_token_count
-                    else:
-                        word_chunk.append(word)
-                        word_tokens += word_token_count
-
-                if word_chunk:
-                    chunks.append(" ".join(word_chunk))
-                continue
+        tokens = self._tokenizer.encode(text.replace("\n", " "))
+        if len(tokens) <= max_tokens:
+            return [text] if text else [""]
 
-            # Check if adding this sentence would exceed the limit
-            if current_tokens + sentence_tokens > max_tokens:
-                # Save current chunk and start a new one
-                if current_chunk:
-                    chunks.append(" ".join(current_chunk))
-                current_chunk = [sentence]
-                current_tokens = sentence_tokens
-            else:
-                current_chunk.append(sentence)
-                current_tokens += sentence_tokens
-
-        # Add the last chunk
-        if current_chunk:
-            chunks.append(" ".join(current_chunk))
+        chunks = []
+        start = 0
+        while start < len(tokens):
+            end = min(start + max_tokens, len(tokens))
+            if end < len(tokens):
+                # Back off to the nearest '.'-terminated token so the split
+                # lands on a sentence boundary; give up after a short
+                # window and cut mid-sentence rather than shrink the chunk.
+                backoff_floor = max(end - self.BOUNDARY_BACKOFF_TOKENS, start + 1)
+                for i in range(end - 1, backoff_floor - 1, -1):
+                    if self._tokenizer.decode([tokens[i]]).rstrip().endswith("."):
+                        end = i + 1
+                        break
+            chunk = self._tokenizer.decode(tokens[start:end]).strip()
+            if chunk:
+                chunks.append(chunk)
+            if end >= len(tokens):
+                break
+            start = max(end - overlap, start + 1)
 
         return chunks if chunks else [text[:max_tokens]]  # Fallback
 
-    def _article_to_metadata(
-        self, article: Article, chunk_index: int = 0, total_chunks: int = 1
-    ) -> Dict[str, Any]:
+    def _article_to_shared_metadata(self, article: Article) -> Dict[str, Any]:
         """
-        Convert article to metadata dictionary for ChromaDB.
+        Build the metadata shared by every chunk of an article.
+
+        Called once per article; per-chunk rows layer their chunk_index /
+        total_chunks on top instead of re-serializing the list fields for
+        each of the K chunks.
 
         Args:
             article: Article object
-            chunk_index: Index of this chunk (0-based)
-            total_chunks: Total number of chunks for this article
 
         Returns:
-            Metadata dictionary
+            Metadata dictionary without chunk indices
         """
         metadata = {
             "url": str(article.url),
@@ -196,11 +487,9 @@ class ChromaDBClient:
             "source_domain": article.source_domain,
             "word_count": article.word_count,
             "scraped_at": article.scraped_at.isoformat(),
-            "authors": json.dumps(article.authors),
-            "meta_keywords": json.dumps(article.meta_keywords),
-            "topics": json.dumps(article.topics) if article.topics else "[]",
-            "chunk_index": chunk_index,
-            "total_chunks": total_chunks,
+            "authors": _json_dumps(article.authors),
+            "meta_keywords": _json_dumps(article.meta_keywords),
+            "topics": _json_dumps(article.topics) if article.topics else "[]",
         }
 
         # Add optional fields if they exist
@@ -215,83 +504,210 @@ class ChromaDBClient:
 
         return metadata
 
-    def store_article(self, article: Article) -> bool:
+    def _article_to_metadata(
+        self, article: Article, chunk_index: int = 0, total_chunks: int = 1
+    ) -> Dict[str, Any]:
         """
-        Store a single article in the database.
+        Convert article to metadata dictionary for ChromaDB.
+
+        Args:
+            article: Article object
+            chunk_index: Index of this chunk (0-based)
+            total_chunks: Total number of chunks for this article
+
+        Returns:
+            Metadata dictionary
+        """
+        return {
+            **self._article_to_shared_metadata(article),
+            "chunk_index": chunk_index,
+            "total_chunks": total_chunks,
+        }
+
+    def _article_to_rows(
+        self, article: Article, token_count: Optional[int] = None
+    ) -> Tuple[List[str], List[str], List[Dict[str, Any]]]:
+        """
+        Expand an article into the (ids, documents, metadatas) rows to store.
         Automatically chunks large articles to fit within embedding model limits.
 
         Args:
-            article: Article object to store
+            article: Article object to expand
+            token_count: Precomputed token count for the full document
+                (title + content), when the caller already batch-counted it
 
         Returns:
-            True if successful, False otherwise
+            Parallel lists of ids, documents and metadata dictionaries
         """
-        try:
-            # Prepare full document content
-            full_document = f"{article.title}\n\n{article.content}"
+        # Prepare full document content
+        full_document = f"{article.title}\n\n{article.content}"
 
-            # Check if document needs chunking
+        # Check if document needs chunking
+        if token_count is None:
             token_count = self._count_tokens(full_document)
 
-            if token_count <= self.MAX_EMBEDDING_TOKENS:
-                # Document fits within limits - store as-is
-                metadata = self._article_to_metadata(article, 0, 1)
+        if token_count <= self.MAX_EMBEDDING_TOKENS:
+            # Document fits within limits - store as-is
+            return (
+                [article.id],
+                [full_document],
+                [self._article_to_metadata(article, 0, 1)],
+            )
 
-                self._collection.add(
-                    documents=[full_document], metadatas=[metadata], ids=[article.id]
-                )
+        # Document exceeds limits - chunk it
+        logger.info(
+            f"Article '{article.title}' has {token_count} tokens, chunking required"
+        )
 
-                logger.debug(
-                    f"Stored article: {article.title} (ID: {article.id}, tokens: {token_count})"
-                )
-            else:
-                # Document exceeds limits - chunk it
-                logger.info(
-                    f"Article '{article.title}' has {token_count} tokens, chunking required"
-                )
+        # Chunk the content (not the title, to avoid repetition)
+        content_chunks = self._chunk_text(
+            article.content,
+            self.MAX_EMBEDDING_TOKENS - self._count_tokens(article.title) - 10,
+        )
 
-                # Chunk the content (not the title, to avoid repetition)
-                content_chunks = self._chunk_text(
-                    article.content,
-                    self.MAX_EMBEDDING_TOKENS - self._count_tokens(article.title) - 10,
-                )
+        documents = []
+        metadatas = []
+        ids = []
+
+        # Serialize the shared fields once; chunks differ only in indices
+        shared_metadata = self._article_to_shared_metadata(article)
+
+        for i, chunk in enumerate(content_chunks):
+            # Combine title with each chunk
+            documents.append(f"{article.title}\n\n{chunk}")
+            metadatas.append(
+                {
+                    **shared_metadata,
+                    "chunk_index": i,
+                    "total_chunks": len(content_chunks),
+                }
+            )
+            ids.append(f"{article.id}_chunk_{i}")
 
-                documents = []
-                metadatas = []
-                ids = []
+        return ids, documents, metadatas
 
-                for i, chunk in enumerate(content_chunks):
-                    # Combine title with each chunk
-                    document = f"{article.title}\n\n{chunk}"
-                    metadata = self._article_to_metadata(
-                        article, i, len(content_chunks)
-                    )
-                    chunk_id = f"{article.id}_chunk_{i}"
+    def store_article(self, article: Article) -> bool:
+        """
+        Store a single article in the database.
+        Automatically chunks large articles to fit within embedding model limits.
 
-                    documents.append(document)
-                    metadatas.append(metadata)
-                    ids.append(chunk_id)
+        Args:
+            article: Article object to store
 
-                # Store all chunks
-                self._collection.add(documents=documents, metadatas=metadatas, ids=ids)
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            ids, documents, metadatas = self._article_to_rows(article)
+            self._collection.add(
+                documents=documents,
+                metadatas=metadatas,
+                ids=ids,
+                embeddings=self._embed_batch(documents),  # type: ignore
+            )
 
+            self._search_cache.clear()
+            if len(ids) == 1:
+                logger.debug(f"Stored article: {article.title} (ID: {article.id})")
+            else:
                 logger.info(
-                    f"Stored article '{article.title}' in {len(content_chunks)} chunks"
+                    f"Stored article '{article.title}' in {len(ids)} chunks"
                 )
-
             return True
 
         except Exception as e:
             logger.error(f"Failed to store article {article.id}: {e}")
             return False
 
-    def store_articles(self, articles: List[Article]) -> Dict[str, int]:
+    def _prepare_rows(
+        self, articles: List[Article]
+    ) -> Tuple[
+        List[str],
+        List[str],
+        List[Dict[str, Any]],
+        List[Tuple[str, int, int]],
+        int,
+    ]:
+        """
+        Dedup and expand articles into the rows a bulk load will write.
+
+        Drops already-stored articles up front with one id-only lookup (so
+        incremental crawls don't re-pay embedding and write costs), batch
+        tokenizes the rest, and expands each into its rows.
+
+        Args:
+            articles: Article objects to prepare
+
+        Returns:
+            Tuple of (ids, documents, metadatas, article row spans,
+            prepare-failure count); the spans map each surviving article
+            to its row range for failure accounting.
+        """
+        # Chunked articles are detected via their first chunk id
+        candidate_ids = [article.id for article in articles] + [
+            f"{article.id}_chunk_0" for article in articles
+        ]
+        existing = self.articles_exist(candidate_ids)
+        if existing:
+            fresh_articles = [
+                article
+                for article in articles
+                if article.id not in existing
+                and f"{article.id}_chunk_0" not in existing
+            ]
+            logger.info(
+                f"Skipping {len(articles) - len(fresh_articles)} already-stored articles"
+            )
+            articles = fresh_articles
+
+        failed_count = 0
+        all_ids: List[str] = []
+        all_documents: List[str] = []
+        all_metadatas: List[Dict[str, Any]] = []
+        # Row span per article so a failed batch can be mapped back to the
+        # articles whose rows it contained.
+        article_spans: List[Tuple[str, int, int]] = []
+
+        if not articles:
+            return all_ids, all_documents, all_metadatas, article_spans, failed_count
+
+        # Tokenize every candidate document in one parallel pass so the
+        # chunk-vs-noop decision doesn't pay a per-article encode call
+        token_counts = self._count_tokens_batch(
+            [f"{article.title}\n\n{article.content}" for article in articles]
+        )
+
+        for article, token_count in zip(articles, token_counts):
+            try:
+                ids, documents, metadatas = self._article_to_rows(
+                    article, token_count
+                )
+            except Exception as e:
+                logger.error(f"Failed to prepare article {article.id}: {e}")
+                failed_count += 1
+                continue
+
+            article_spans.append(
+                (article.id, len(all_ids), len(all_ids) + len(ids))
+            )
+            all_ids.extend(ids)
+            all_documents.extend(documents)
+            all_metadatas.extend(metadatas)
+
+        return all_ids, all_documents, all_metadatas, article_spans, failed_count
+
+    def store_articles(
+        self, articles: List[Article], batch_size: int = 200
+    ) -> Dict[str, int]:
         """
         Store multiple articles in the database.
-        Uses individual storage for each article to handle chunking properly.
+        All articles (including chunk expansions) are accumulated into large
+        add() batches so N articles cost ceil(rows / batch_size) embedding
+        round-trips and writes instead of N.
 
         Args:
             articles: List of Article objects to store
+            batch_size: Maximum number of rows per add() call
 
         Returns:
             Dictionary with success and failure counts
@@ -300,15 +716,140 @@ class ChromaDBClient:
             logger.warning("No articles to store")
             return {"success": 0, "failed": 0}
 
-        success_count = 0
-        failed_count = 0
+        all_ids, all_documents, all_metadatas, article_spans, failed_count = (
+            self._prepare_rows(articles)
+        )
 
-        # Store articles individually to handle chunking
-        for article in articles:
-            if self.store_article(article):
-                success_count += 1
+        failed_rows: set = set()
+        with self.bulk_mode():
+            for start in range(0, len(all_ids), batch_size):
+                batch = slice(start, start + batch_size)
+                try:
+                    self._collection.add(
+                        documents=all_documents[batch],
+                        metadatas=all_metadatas[batch],
+                        ids=all_ids[batch],
+                        embeddings=self._embed_batch(all_documents[batch]),  # type: ignore
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to store batch starting at row {start}: {e}")
+                    failed_rows.update(
+                        range(start, min(start + batch_size, len(all_ids)))
+                    )
+
+        if all_ids:
+            self._search_cache.clear()
+
+        success_count = 0
+        for _, row_start, row_end in article_spans:
+            if failed_rows and any(row in failed_rows for row in range(row_start, row_end)):
+                failed_count += 1
             else:
+                success_count += 1
+
+        logger.info(
+            f"Successfully stored {success_count} articles, {failed_count} failed"
+        )
+        return {"success": success_count, "failed": failed_count}
+
+    async def store_articles_async(
+        self, articles: List[Article], batch_size: int = 200
+    ) -> Dict[str, int]:
+        """
+        Store multiple articles, overlapping embedding with database writes.
+        Embedding (network-bound) and add() (disk-bound) use independent
+        resources, so a producer fetches embeddings for batch N+1 while a
+        consumer writes batch N; wall time approaches the slower of the
+        two phases per batch instead of their sum.
+
+        Args:
+            articles: List of Article objects to store
+            batch_size: Maximum number of rows per add() call
+
+        Returns:
+            Dictionary with success and failure counts
+        """
+        if not articles:
+            logger.warning("No articles to store")
+            return {"success": 0, "failed": 0}
+
+        all_ids, all_documents, all_metadatas, article_spans, failed_count = (
+            self._prepare_rows(articles)
+        )
+
+        failed_rows: set = set()
+        # Small buffer: one batch being written, one being embedded
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+
+        async def _producer() -> None:
+            for start in range(0, len(all_ids), batch_size):
+                batch = slice(start, start + batch_size)
+                try:
+                    # _embed_batch is cache-aware; run it off-loop so its
+                    # network wait doesn't block the consumer
+                    vectors = await asyncio.to_thread(
+                        self._embed_batch, all_documents[batch]
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to embed batch starting at row {start}: {e}")
+                    failed_rows.update(
+                        range(start, min(start + batch_size, len(all_ids)))
+                    )
+                    continue
+                await queue.put((start, batch, vectors))
+            await queue.put(None)
+
+        loop = asyncio.get_running_loop()
+
+        async def _consumer(writer: ThreadPoolExecutor) -> None:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                start, batch, vectors = item
+                try:
+                    await loop.run_in_executor(
+                        writer,
+                        partial(
+                            self._collection.add,
+                            documents=all_documents[batch],
+                            metadatas=all_metadatas[batch],
+                            ids=all_ids[batch],
+                            embeddings=vectors,
+                        ),
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to store batch starting at row {start}: {e}")
+                    failed_rows.update(
+                        range(start, min(start + batch_size, len(all_ids)))
+                    )
+
+        # Chroma's SQLite connection pool is thread-local and the bulk-mode
+        # pragmas (other than WAL) are per-connection, so they only take
+        # effect on the thread that executes the writes. Run every add() on
+        # one dedicated writer thread and enter/exit bulk mode on that same
+        # thread, instead of asyncio.to_thread's rotating pool.
+        with ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="chroma-writer"
+        ) as writer:
+            bulk = self.bulk_mode()
+            await loop.run_in_executor(writer, bulk.__enter__)
+            try:
+                await asyncio.gather(_producer(), _consumer(writer))
+            finally:
+                await loop.run_in_executor(
+                    writer, partial(bulk.__exit__, None, None, None)
+                )
+
+        if all_ids:
+            self._search_cache.clear()
+
+        success_count = 0
+        for _, row_start, row_end in article_spans:
+            if failed_rows and any(row in failed_rows for row in range(row_start, row_end)):
                 failed_count += 1
+            else:
+                success_count += 1
 
         logger.info(
             f"Successfully stored {success_count} articles, {failed_count} failed"
@@ -354,17 +895,40 @@ class ChromaDBClient:
             True if article exists, False otherwise
         """
         try:
-            result = self._collection.get(ids=[article_id])
+            # include=[] keeps this an id-index probe; the default includes
+            # would materialize the document text just to check length
+            result = self._collection.get(ids=[article_id], include=[])
             return len(result["ids"]) > 0
         except Exception as e:
             logger.error(f"Failed to check article existence {article_id}: {e}")
             return False
 
+    def articles_exist(self, article_ids: List[str]) -> Set[str]:
+        """
+        Check which of the given article IDs exist, in one lookup.
+
+        Args:
+            article_ids: Article IDs to check
+
+        Returns:
+            The subset of IDs present in the collection
+        """
+        if not article_ids:
+            return set()
+        try:
+            return set(self._collection.get(ids=article_ids, include=[])["ids"])
+        except Exception as e:
+            logger.error(f"Failed to check existence of {len(article_ids)} articles: {e}")
+            return set()
+
     def search_articles(
         self, query: str, n_results: int = 10, where: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, Any]]:
         """
         Search for articles using semantic search.
+        Identical (query, n_results, where) calls are served from an
+        in-process LRU cache that writes invalidate, so repeated dashboard
+        queries skip the query embedding and HNSW traversal.
 
         Args:
             query: Search query
@@ -374,6 +938,13 @@ class ChromaDBClient:
         Returns:
             List of matching articles
         """
+        cache_key = (query, n_results, _freeze(where))
+        cached = self._search_cache.pop(cache_key, None)
+        if cached is not None:
+            # Re-insert to mark as most recently used
+            self._search_cache[cache_key] = cached
+            return self._copy_rows(cached)
+
         try:
             results = self._collection.query(
                 query_texts=[query],
@@ -393,42 +964,89 @@ class ChromaDBClient:
                     }
                 )
 
-            return articles
+            while len(self._search_cache) >= self.SEARCH_CACHE_MAX:
+                # Evict the least recently used entry (dicts keep insertion
+                # order; hits re-insert, so the first key is the oldest)
+                self._search_cache.pop(next(iter(self._search_cache)))
+            self._search_cache[cache_key] = articles
+
+            return self._copy_rows(articles)
 
         except Exception as e:
             logger.error(f"Failed to search articles: {e}")
             return []
 
-    def get_all_articles(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _copy_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Retrieve all articles from the database.
+        Copy cached search rows so callers can't mutate the cache.
+
+        The row dicts (and their metadata dicts) live in the search cache;
+        handing them out directly would let a caller that post-processes a
+        result corrupt every later hit for the same key.
 
         Args:
-            limit: Optional limit on number of articles to retrieve
+            rows: Cached result rows
 
         Returns:
-            List of all articles
+            Independent copies of the rows, metadata included
         """
-        try:
-            result = self._collection.get(
-                include=["documents", "metadatas"], limit=limit
-            )
+        return [{**row, "metadata": dict(row["metadata"] or {})} for row in rows]
 
-            articles = []
-            for i in range(len(result["ids"])):
-                articles.append(
-                    {
-                        "id": result["ids"][i],
-                        "document": result["documents"][i],  # type: ignore
-                        "metadata": result["metadatas"][i],  # type: ignore
-                    }
+    def iter_articles(
+        self, limit: Optional[int] = None, page_size: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over articles in the database, one page at a time.
+
+        Pages through the collection with offset/limit so memory stays
+        O(page_size) instead of materializing every document at once, and
+        the first records are available after a single page fetch.
+
+        Args:
+            limit: Optional cap on the number of articles yielded
+            page_size: Number of rows fetched per underlying get() call
+
+        Yields:
+            Article dictionaries with id, document and metadata
+        """
+        yielded = 0
+        offset = 0
+        while limit is None or yielded < limit:
+            fetch = page_size
+            if limit is not None:
+                fetch = min(fetch, limit - yielded)
+            try:
+                result = self._collection.get(
+                    include=["documents", "metadatas"], limit=fetch, offset=offset
                 )
+            except Exception as e:
+                logger.error(f"Failed to retrieve articles page at {offset}: {e}")
+                return
 
-            return articles
+            for i in range(len(result["ids"])):
+                yield {
+                    "id": result["ids"][i],
+                    "document": result["documents"][i],  # type: ignore
+                    "metadata": result["metadatas"][i],  # type: ignore
+                }
 
-        except Exception as e:
-            logger.error(f"Failed to retrieve all articles: {e}")
-            return []
+            yielded += len(result["ids"])
+            offset += len(result["ids"])
+            if len(result["ids"]) < fetch:
+                return
+
+    def get_all_articles(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Retrieve all articles from the database.
+
+        Args:
+            limit: Optional limit on number of articles to retrieve
+
+        Returns:
+            List of all articles
+        """
+        return list(self.iter_articles(limit=limit))
 
     def delete_article(self, article_id: str) -> bool:
         """
@@ -442,6 +1060,7 @@ class ChromaDBClient:
         """
         try:
             self._collection.delete(ids=[article_id])
+            self._search_cache.clear()
             logger.info(f"Deleted article: {article_id}")
             return True
 
@@ -471,10 +1090,15 @@ class ChromaDBClient:
         """
         try:
             self._client.delete_collection(name=self.collection_name)
+            # Recreate with the same HNSW tuning and embedding function as
+            # the original, otherwise the reset collection silently falls
+            # back to default parameters and default embeddings
             self._collection = self._client.get_or_create_collection(
                 name=self.collection_name,
-                metadata={"description": "News articles collection"},
+                metadata=self._collection_metadata(),
+                embedding_function=self._embedding_function,  # type: ignore
             )
+            self._search_cache.clear()
             logger.warning(f"Collection '{self.collection_name}' has been reset")
             return True
 
@@ -482,6 +1106,24 @@ class ChromaDBClient:
             logger.error(f"Failed to reset collection: {e}")
             return False
 
+    def get_or_create_aux_collection(
+        self, name: str, metadata: Optional[Dict[str, Any]] = None
+    ) -> Collection:
+        """
+        Get or create a secondary collection on the same persistent client.
+
+        Used for auxiliary stores (e.g. response caches) that should live in
+        the same database directory as the articles collection.
+
+        Args:
+            name: Collection name
+            metadata: Optional collection metadata (e.g. HNSW settings)
+
+        Returns:
+            ChromaDB Collection object
+        """
+        return self._client.get_or_create_collection(name=name, metadata=metadata)
+
     def get_collection(self) -> Collection:
         """
         Get the underlying ChromaDB collection.
@@ -0,0 +1,105 @@
+"""Persistent content-hash cache for OpenAI embeddings.
+
+Re-ingesting an unchanged article (or re-indexing after a metadata tweak)
+previously re-embedded every text through the remote API. This module
+keeps a local SQLite table keyed by ``sha256(model + "\\x00" + text)`` so
+only texts never seen by the configured model pay the network round-trip;
+cache hits are a local key lookup. Keys are namespaced by model name, so
+switching embedding models invalidates cleanly.
+
+Vectors are stored int8-quantized with a per-vector FP32 scale prefix
+(4x smaller than raw FP32) and dequantized on read; OpenAI embeddings
+are unit-normalised, so the sub-percent rounding error is negligible for
+cosine retrieval.
+"""
+
+import hashlib
+import sqlite3
+import struct
+from functools import lru_cache
+from typing import Dict, Iterable, List
+
+from news_scraper.config.settings import settings_instance as settings
+
+
+@lru_cache(maxsize=1)
+def _connection() -> sqlite3.Connection:
+    """Open (once per process) the persistent embedding cache database.
+
+    Returns:
+        sqlite3.Connection: Connection with the cache table ensured.
+    """
+    conn = sqlite3.connect(
+        str(settings.data_dir / "embeddings_cache.sqlite"), check_same_thread=False
+    )
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS embedding_cache "
+        "(key TEXT PRIMARY KEY, vec BLOB NOT NULL)"
+    )
+    return conn
+
+
+def text_key(model: str, text: str) -> str:
+    """Build the cache key for a (model, text) pair.
+
+    Args:
+        model: Embedding model name (namespaces the key).
+        text: Text whose embedding is cached.
+
+    Returns:
+        str: Hex digest identifying this text under this model.
+    """
+    return hashlib.sha256(f"{model}\x00{text}".encode()).hexdigest()
+
+
+def pack_vector(vector: List[float]) -> bytes:
+    """Serialize an embedding as int8 with a per-vector FP32 scale prefix."""
+    scale = max(abs(component) for component in vector) / 127.0 or 1.0
+    quantized = [round(component / scale) for component in vector]
+    return struct.pack(f"<f{len(quantized)}b", scale, *quantized)
+
+
+def unpack_vector(blob: bytes) -> List[float]:
+    """Deserialize and dequantize an embedding stored by :func:`pack_vector`."""
+    (scale,) = struct.unpack_from("<f", blob)
+    quantized = struct.unpack_from(f"{len(blob) - 4}b", blob, 4)
+    return [component * scale for component in quantized]
+
+
+def get_many(keys: Iterable[str]) -> Dict[str, List[float]]:
+    """Fetch cached embeddings for the given keys.
+
+    Args:
+        keys: Cache keys produced by :func:`text_key`.
+
+    Returns:
+        Dict[str, List[float]]: Mapping of found keys to their vectors;
+        missing keys are simply absent.
+    """
+    keys = list(keys)
+    if not keys:
+        return {}
+    placeholders = ",".join("?" * len(keys))
+    rows = _connection().execute(
+        f"SELECT key, vec FROM embedding_cache WHERE key IN ({placeholders})", keys
+    ).fetchall()
+    return {key: unpack_vector(blob) for key, blob in rows}
+
+
+def set_many(vectors: Dict[str, List[float]]) -> None:
+    """Store embeddings under their keys, replacing existing entries.
+
+    Args:
+        vectors: Mapping of cache keys to embedding vectors.
+
+    Returns:
+        None: Entries are committed to the cache database.
+    """
+    if not vectors:
+        return
+    conn = _connection()
+    conn.executemany(
+        "INSERT OR REPLACE INTO embedding_cache (key, vec) VALUES (?, ?)",
+        [(key, pack_vector(vector)) for key, vector in vectors.items()],
+    )
+    conn.commit()
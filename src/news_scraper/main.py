@@ -1,12 +1,28 @@
 """Main entry point for the news scraper application."""
 
-from news_scraper.utils.arg_parser import arg_parser
+import asyncio
+import mmap
+
+from prompt_toolkit import PromptSession
+from prompt_toolkit.history import FileHistory
+
+from news_scraper.utils.arg_parser import get_arg_parser
 from news_scraper.utils.logging import logger
 from news_scraper.config.settings import settings_instance as settings
 from news_scraper.core.scraper import NewsScraper
 from news_scraper.db import ChromaDBClient
-from news_scraper.utils.helpers import is_valid_url
-from news_scraper.core.llamaindex import query_engine
+from news_scraper.utils.helpers import is_valid_url, normalize_url
+from news_scraper.core.llamaindex import cached_query, get_query_engine
+
+try:
+    # uvloop's libuv-based event loop speeds up the scraping and REPL
+    # coroutines; fall back to asyncio's default loop where it's absent
+    # (e.g. Windows)
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
 
 
 def main():
@@ -15,19 +31,33 @@ def main():
     Returns:
         None: The function orchestrates side effects only.
     """
-    args = arg_parser.parse_args()
+    args = get_arg_parser().parse_args()
     logger.info(f"Starting {settings.app_name} v{settings.app_version}")
 
     if args.urls_file is not None:
         logger.info("Scraping urls mode activated.")
 
         try:
-            with open(args.urls_file, "r", encoding="utf-8") as f:
-                urls = []
-                for line in f:
-                    # Accept only well-formed HTTP(S) URLs from the file, skipping comments or blanks.
-                    if line.startswith("http") and is_valid_url(line.strip()):
-                        urls.append(line.strip())
+            # mmap instead of read(): the OS pages content in as needed and
+            # bytes.splitlines runs in C over the mapped buffer, with no
+            # text-mode decode of lines that get filtered out anyway.
+            with open(args.urls_file, "rb") as f:
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        raw_lines = mm[:].splitlines()
+                except ValueError:  # An empty file cannot be mapped
+                    raw_lines = []
+            # Accept only well-formed HTTP(S) URLs, skipping comments or
+            # blanks - one strip, one decode and one regex match per line
+            urls = [
+                line
+                for raw in raw_lines
+                if (line := raw.strip().decode("utf-8", "ignore"))
+                and is_valid_url(line)
+            ]
+            # Normalize before deduping so tracking-parameter variants of
+            # the same page collapse to one scrape
+            urls = list(dict.fromkeys(normalize_url(url) for url in urls))
             if not urls:
                 logger.warning(
                     f"The file '{args.urls_file}' is empty. No URLs to scrape."
@@ -46,52 +76,115 @@ def main():
         )
 
         async def run_scraper():
-            """Execute the asynchronous scraping workflow and return collected articles.
+            """Scrape URLs and store finished articles while later scrapes run.
+
+            A producer/consumer pair overlaps network-bound scraping with
+            embedding and persistence: workers put each article on a queue
+            as soon as it's done, and the consumer stores them in batches.
 
             Returns:
-                list[news_scraper.models.article.Article]: Collected article models.
+                tuple[list, dict]: Collected article models and the
+                accumulated store success/failure counts.
             """
+            article_queue: asyncio.Queue = asyncio.Queue()
+            totals = {"success": 0, "failed": 0}
+
+            async def consume():
+                batch = []
+                while True:
+                    article = await article_queue.get()
+                    done = article is None
+                    if not done:
+                        batch.append(article)
+                    # Flush on the sentinel, on a full batch, or when the
+                    # scraper has momentarily run dry
+                    if batch and (done or len(batch) >= 32 or article_queue.empty()):
+                        # Off-loop: storing blocks on embedding HTTP and
+                        # SQLite writes, which would stall in-flight scrapes
+                        result = await asyncio.to_thread(db.store_articles, batch)
+                        totals["success"] += result["success"]
+                        totals["failed"] += result["failed"]
+                        batch = []
+                    if done:
+                        return
+
             async with NewsScraper() as news_scraper:
-                articles = await news_scraper.scrape_urls(urls)
+                articles, _ = await asyncio.gather(
+                    news_scraper.scrape_urls(urls, result_queue=article_queue),
+                    consume(),
+                )
                 logger.info(f"Scraped {len(articles)} articles")
-            return articles
+            return articles, totals
+
+        articles, store_totals = asyncio.run(run_scraper())
 
-        import asyncio
+        logger.info(
+            f"Stored {store_totals['success']} articles, {store_totals['failed']} failed"
+        )
+
+        # The full-collection enumeration is debug-only output; skip the
+        # scan (and the per-article f-strings) entirely unless it's wanted
+        if settings.log_level.upper() == "DEBUG":
+            all_articles = db.get_all_articles()
+            logger.debug(f"Total articles saved in database: {len(all_articles)}")
+            for art in all_articles:
+                logger.debug(
+                    f"Article ID: {art['id']}, Title: {art['metadata']['title']}"
+                )
 
-        articles = asyncio.run(run_scraper())
+    if args.query:
+        asyncio.run(run_query_repl())
 
-        for article in articles:
-            # Store a single article
-            success = db.store_article(article)
-            logger.debug(f"Article stored: {success}")
-            # logger.debug(f"Title: {article.title}\n URL: {article.url}\n Summary: {article.summary}\n Content: {article.content}\n Topics: {article.topics}")
 
-        all_articles = db.get_all_articles()
-        logger.debug(f"Total articles saved in database: {len(all_articles)}")
-        for art in all_articles:
-            logger.debug(f"Article ID: {art['id']}, Title: {art['metadata']['title']}")
+async def run_query_repl() -> None:
+    """Run the interactive query loop with history and background warm-up.
 
-    if args.query is not None:
+    Returns:
+        None: Answers are printed as a side effect.
+    """
+    session: PromptSession = PromptSession(
+        history=FileHistory(str(settings.data_dir / ".query_history"))
+    )
+    # Build the index and query engine while the user types their first
+    # query instead of paying the setup cost on it
+    warmup = asyncio.create_task(asyncio.to_thread(get_query_engine))
+    try:
         while True:
-            input_query = input("\n\nEnter your query (or 'exit' to quit): ").strip()
+            try:
+                input_query = (
+                    await session.prompt_async("\n\nEnter your query (or 'exit' to quit): ")
+                ).strip()
+            except (EOFError, KeyboardInterrupt):
+                logger.info("Exiting the application.")
+                return
             if input_query.lower() == "exit":
                 logger.info("Exiting the application.")
                 return
             if not input_query:
                 print("Please enter a valid query.")
                 continue
-            query = input_query
-            response = query_engine.query(query)
-            print(f"\nResponse: {response}")
-            print("\nSource Articles:")
-            for node in response.source_nodes:
-                # The metadata from your original Article object is preserved!
-                title = node.node.metadata.get("title", "No Title")
-                score = node.score
-                print(
-                    f"  - Retrieved article '{title}' with a similarity score of: {score:.4f}"
-                )
-            input_query = ""  # Reset to prompt for new input
+            response = await asyncio.to_thread(cached_query, input_query)
+            if hasattr(response, "response_gen"):
+                # Streamed response: print tokens as they arrive
+                print("\nResponse: ", end="", flush=True)
+                for token in response.response_gen:
+                    print(token, end="", flush=True)
+                print()
+            else:
+                print(f"\nResponse: {response}")
+            # Semantic-cache hits return plain text without source nodes
+            if hasattr(response, "source_nodes"):
+                print("\nSource Articles:")
+                for node in response.source_nodes:
+                    # The metadata from your original Article object is preserved!
+                    title = node.node.metadata.get("title", "No Title")
+                    score = node.score
+                    print(
+                        f"  - Retrieved article '{title}' with a similarity score of: {score:.4f}"
+                    )
+    finally:
+        if not warmup.done():
+            warmup.cancel()
 
 
 if __name__ == "__main__":
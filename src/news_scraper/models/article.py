@@ -1,19 +1,33 @@
 """Data models for articles and related entities."""
 
-import uuid
-from datetime import datetime
+import hashlib
+import re
+from datetime import datetime, timezone
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+# Counting matches avoids allocating the full token list str.split builds
+# for multi-KB article bodies
+_WORD_RE = re.compile(r"\S+")
 
 
 class Article(BaseModel):
     """Structured representation of a scraped news article and model metadata."""
 
+    # frozen avoids per-instance mutation bookkeeping and makes articles
+    # safely shareable across coroutines; str_strip_whitespace moves the
+    # trimming callers did by hand into the C validation pass.
+    model_config = ConfigDict(
+        extra="ignore", frozen=True, str_strip_whitespace=True
+    )
+
     id: str = Field(
-        default_factory=lambda: str(uuid.uuid4()), description="Unique article ID"
+        default="", description="Unique article ID (BLAKE2b hash of the URL)"
     )
-    url: HttpUrl = Field(description="Article URL")
+    # Plain str: URLs are validated/normalized by the scraping pipeline
+    # before construction, and HttpUrl is among pydantic's slowest validators
+    url: str = Field(description="Article URL")
     title: str = Field(description="Article title")
     content: str = Field(description="Article content")
     authors: List[str] = Field(default_factory=list, description="Article authors")
@@ -21,7 +35,9 @@ class Article(BaseModel):
         default=None, description="Publication date"
     )
     scraped_at: datetime = Field(
-        default_factory=datetime.utcnow, description="When article was scraped"
+        # datetime.utcnow is deprecated in 3.12 and returned naive datetimes
+        default_factory=lambda: datetime.now(timezone.utc),
+        description="When article was scraped",
     )
     top_image: Optional[str] = Field(default=None, description="Top image URL")
     meta_description: str = Field(default="", description="Meta description")
@@ -33,15 +49,32 @@ class Article(BaseModel):
         default_factory=list, description="Article topics"
     )
 
-    def __post_init__(self):
-        """Populate derived fields once the model is instantiated.
+    @model_validator(mode="after")
+    def _derive_id(self) -> "Article":
+        """Derive a deterministic ID from the URL when none is provided.
 
-        Calculates ``word_count`` lazily when the caller does not provide it.
+        Hashing the URL (instead of uuid4) makes re-scrapes idempotent:
+        the same page always maps to the same row in the vector store.
         """
-        if self.word_count == 0:
-            self.word_count = len(self.content.split())
+        if not self.id:
+            object.__setattr__(
+                self,
+                "id",
+                hashlib.blake2b(str(self.url).encode(), digest_size=16).hexdigest(),
+            )
+        return self
 
-    class Config:
-        """Pydantic configuration."""
+    @model_validator(mode="after")
+    def _fill_word_count(self) -> "Article":
+        """Populate ``word_count`` when the caller does not provide it.
 
-        json_encoders = {datetime: lambda v: v.isoformat()}
+        This used to live in ``__post_init__``, which pydantic models never
+        call - so the count silently stayed 0.
+        """
+        if self.word_count == 0 and self.content:
+            object.__setattr__(
+                self,
+                "word_count",
+                sum(1 for _ in _WORD_RE.finditer(self.content)),
+            )
+        return self
@@ -1,4 +1,5 @@
 import argparse
+from functools import lru_cache
 
 
 class ArgParser:
@@ -38,5 +39,14 @@ class ArgParser:
         return self.parser.parse_args()
 
 
-# Create a single instance for easy import
-arg_parser = ArgParser()
+@lru_cache(maxsize=1)
+def get_arg_parser() -> ArgParser:
+    """Build (once, on first use) the shared CLI parser.
+
+    Keeping construction lazy means importing the package doesn't pay for
+    argparse setup; only code that actually parses arguments does.
+
+    Returns:
+        ArgParser: The process-wide parser instance.
+    """
+    return ArgParser()
@@ -46,7 +46,9 @@ def setup_logging(
     log_path = Path(log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Add file handler with rotation
+    # Add file handler with rotation. enqueue routes records through a
+    # background writer so scraper coroutines never block on disk I/O, and
+    # the larger buffer batches writes between flushes.
     logger.add(
         log_file,
         level=log_level,
@@ -56,6 +58,8 @@ def setup_logging(
         compression="zip",
         backtrace=True,
         diagnose=True,
+        enqueue=True,
+        buffering=1 << 16,
     )
 
     logger.debug(f"Logging initialized - Level: {log_level}, File: {log_file}")